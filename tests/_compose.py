@@ -0,0 +1,253 @@
+"""
+Docker Compose helpers shared by the E2E and performance test fixtures.
+Both suites run the same `olm-api-test` stack, so its commands are defined once here.
+"""
+
+import hashlib
+import os
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+# Docker Compose arguments shared by every command run against the test stack
+COMPOSE_BASE = (
+    "compose",
+    "-f",
+    "docker-compose.yml",
+    "-f",
+    "docker-compose.test.override.yml",
+    "--project-name",
+    "olm-api-test",
+)
+# Rebuilds only the api image; other services keep their existing images
+COMPOSE_BUILD_API = COMPOSE_BASE + ("build", "api")
+# `--wait` blocks until every service reports healthy via its healthcheck
+COMPOSE_UP = COMPOSE_BASE + ("up", "-d", "--wait", "--wait-timeout", "300")
+# The stack is discarded, so skip the default 10s graceful-stop wait
+COMPOSE_DOWN = COMPOSE_BASE + ("down", "-v", "--remove-orphans", "--timeout", "1")
+# Only the most recent lines are useful when diagnosing a failed startup
+COMPOSE_LOGS = COMPOSE_BASE + ("logs", "--no-color", "--tail", "200")
+# Upper bound for each startup step; longer than `--wait-timeout` so compose
+# reports an unhealthy service itself before the step is killed
+COMPOSE_STEP_TIMEOUT = 600
+# Host-side health confirmation once `up --wait` has returned
+_HEALTH_TIMEOUT = 30
+# How long to keep echoing output after a command has exited or been killed
+_READER_JOIN_TIMEOUT = 5
+
+# Build with BuildKit so images carry inline cache metadata and can seed later
+# builds via `cache_from` (see docker-compose.test.override.yml)
+_BUILDKIT_ENV = {"DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1"}
+# Optional registry image used as an extra build cache source (e.g. in CI)
+_CACHE_IMAGE_VAR = "E2E_CACHE_IMAGE"
+
+# Inputs of the api image build, hashed to decide whether a rebuild is needed
+_API_IMAGE = "olm-api:latest"
+_API_IMAGE_LABEL = "olm-api.source-digest"
+_API_BUILD_FILES = (
+    "Dockerfile",
+    "pyproject.toml",
+    "uv.lock",
+    "README.md",
+    "entrypoint.sh",
+    "docker-compose.yml",
+    "docker-compose.test.override.yml",
+)
+_API_BUILD_DIRS = ("src", "sdk", "alembic")
+
+
+def docker_command() -> list[str]:
+    """Return the docker executable, prefixed with `sudo -E` when SUDO is set."""
+    use_sudo = os.getenv("SUDO", "").lower() in ("1", "true", "yes")
+    return ["sudo", "-E", "docker"] if use_sudo else ["docker"]
+
+
+def logs_command(docker: list[str]) -> list[str]:
+    """Build the command that prints recent logs from every service."""
+    return docker + list(COMPOSE_LOGS)
+
+
+def run_streaming(
+    command: list[str],
+    env: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> int:
+    """
+    Run a command, echoing its combined stdout/stderr line by line.
+
+    Output is forwarded as it is produced instead of being buffered until the
+    process exits, so long builds show progress and failures surface at once.
+    A reader thread does the echoing so the process can be waited on with a
+    deadline. The command runs in its own process group; if `timeout` elapses
+    the whole group is killed (`docker`/`sudo` spawn compose as a child) and
+    `subprocess.TimeoutExpired` is raised.
+    """
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=env,
+        start_new_session=True,
+    ) as process:
+
+        def echo_output() -> None:
+            for line in process.stdout:
+                print(line, end="")
+
+        reader = threading.Thread(target=echo_output, daemon=True)
+        reader.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            process.wait()
+            raise
+        finally:
+            # A process that escaped the group may still hold the pipe open
+            reader.join(timeout=_READER_JOIN_TIMEOUT)
+    return process.returncode
+
+
+def source_digest() -> str:
+    """
+    Compute a SHA-256 digest over every input of the api image build.
+
+    Paths are hashed alongside their contents so renames also change the
+    digest. Bytecode caches are skipped as they are excluded from the build
+    context by .dockerignore.
+    """
+    paths = [Path(name) for name in _API_BUILD_FILES]
+    for directory in _API_BUILD_DIRS:
+        paths.extend(
+            sorted(
+                path
+                for path in Path(directory).rglob("*")
+                if path.is_file() and "__pycache__" not in path.parts
+            )
+        )
+
+    digest = hashlib.sha256()
+    for path in paths:
+        if not path.is_file():
+            continue
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def image_source_digest(docker: list[str]) -> str | None:
+    """Return the source digest label of the local api image, if any."""
+    result = subprocess.run(
+        docker
+        + [
+            "image",
+            "inspect",
+            _API_IMAGE,
+            "--format",
+            f'{{{{ index .Config.Labels "{_API_IMAGE_LABEL}" }}}}',
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def pull_cache_image(docker: list[str]) -> None:
+    """
+    Pull the build cache image named by E2E_CACHE_IMAGE, if one is set.
+
+    A failed pull is not fatal; the build then falls back to local layers.
+    """
+    cache_image = os.getenv(_CACHE_IMAGE_VAR)
+    if cache_image:
+        print(f"\nPulling build cache image {cache_image}...")
+        subprocess.run(docker + ["pull", cache_image], check=False)
+
+
+def up_commands(docker: list[str]) -> tuple[list[list[str]], dict[str, str]]:
+    """
+    Build the commands that start the stack, rebuilding the api image only when needed.
+
+    The api image is rebuilt only when its build inputs differ from those the
+    local image was built from; otherwise compose reuses the tagged image
+    as-is and the build context is never sent to the daemon. The rebuild is
+    scoped to the api service so other images are left alone.
+
+    Returns the commands to run in order and the environment to run them
+    with: the current environment with BuildKit enabled and the digest the
+    rebuilt image is labelled with.
+    """
+    digest = source_digest()
+    compose_env = {**os.environ, **_BUILDKIT_ENV, "E2E_SOURCE_DIGEST": digest}
+    commands = []
+    if image_source_digest(docker) != digest:
+        commands.append(docker + list(COMPOSE_BUILD_API))
+    commands.append(docker + list(COMPOSE_UP))
+    return commands, compose_env
+
+
+def start_stack(docker: list[str], host: str, port: int) -> None:
+    """
+    Start the test stack and confirm the API answers from the host.
+
+    Pulls the optional build cache image, then runs each `up_commands` step
+    under COMPOSE_STEP_TIMEOUT. `up` already waits for every healthcheck, so
+    the final poll only confirms that the published port answers. Raises
+    RuntimeError if a step fails or the API does not answer, in the latter
+    case with the most recent service logs.
+    """
+    pull_cache_image(docker)
+    commands, compose_env = up_commands(docker)
+    for command in commands:
+        returncode = run_streaming(
+            command, env=compose_env, timeout=COMPOSE_STEP_TIMEOUT
+        )
+        if returncode != 0:
+            raise RuntimeError(
+                f"Failed to start services (exit code {returncode}). See output above."
+            )
+
+    if not wait_for_health(host, port, timeout=_HEALTH_TIMEOUT):
+        log_result = subprocess.run(
+            logs_command(docker), capture_output=True, text=True
+        )
+        raise RuntimeError(
+            f"Application failed to become healthy within {_HEALTH_TIMEOUT} seconds.\nLogs:\n{log_result.stdout}\n{log_result.stderr}"
+        )
+
+
+def wait_for_health(host: str, port: int, timeout: float = 120) -> bool:
+    """
+    Wait for the application to be healthy.
+
+    Polls with a capped exponential backoff (50ms growing 1.5x up to 2s) so a
+    service that comes up quickly is detected almost immediately. All probes
+    share one keep-alive client, and transport retries are disabled so the
+    backoff alone controls the polling.
+    """
+    url = f"http://{host}:{port}/health"
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    with httpx.Client(
+        timeout=1.0, transport=httpx.HTTPTransport(retries=0)
+    ) as probe_client:
+        while time.monotonic() < deadline:
+            try:
+                response = probe_client.get(url)
+                if 200 <= response.status_code < 300:
+                    return True
+            except httpx.RequestError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+    return False
@@ -4,21 +4,69 @@ This file contains fixtures that are shared across different test types.
 """
 
 import os
+from pathlib import Path
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
+import uvloop
 from dotenv import load_dotenv
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from olm_api_sdk.v1.mock_client import MockOlmClientV1
 
-from src.olm_api.api.v1.ollama_service_v1 import OllamaServiceV1
-from src.olm_api.api.v2.ollama_service_v2 import OllamaServiceV2
-from src.olm_api.main import app
-from src.olm_api.middlewares import db_logging_middleware
+# =============================================================================
+# Environment Configuration
+# =============================================================================
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Loads the environment once per process, before any test is collected.
+
+    Reading `.env` and applying the Docker Compose defaults here keeps the
+    controller and every xdist worker in the same state, regardless of which
+    fixtures happen to run first.
+    """
+    load_dotenv()
+
+    # Set environment variables for Docker Compose
+    os.environ["HOST_BIND_IP"] = os.getenv("HOST_BIND_IP", "127.0.0.1")
+    os.environ["TEST_PORT"] = os.getenv("TEST_PORT", "8002")
+    os.environ["BUILT_IN_OLLAMA_MODELS"] = os.getenv(
+        "BUILT_IN_OLLAMA_MODELS", "qwen3:0.6b"
+    )
+
 
-# Load environment variables from .env file
-load_dotenv()
+# Suites that share a session-scoped `http_client` against the running stack
+_SESSION_LOOP_DIRS = (
+    Path(__file__).parent / "e2e",
+    Path(__file__).parent / "perf",
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Run every E2E and performance test on the session-scoped event loop.
+
+    This lets those tests share their suite's session-scoped `http_client`,
+    whose pooled connections are bound to the loop they were opened on.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item) and any(
+            item.path.is_relative_to(directory) for directory in _SESSION_LOOP_DIRS
+        ):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    """
+    Runs every async test on uvloop, the same event loop the API is served on.
+    """
+    return uvloop.EventLoopPolicy()
 
 
 # =============================================================================
@@ -74,16 +122,37 @@ def custom_response_client():
     return _create_client
 
 
+# =============================================================================
+# Application Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    Provides the FastAPI application for in-process tests.
+
+    The application is imported on first use rather than at conftest import,
+    so suites that only talk to a running stack (e2e, perf) or to the SDK do
+    not load the API, its services and the database layer during collection.
+    """
+    from src.olm_api.main import app
+
+    return app
+
+
 # =============================================================================
 # Service Mock Fixtures
 # =============================================================================
 
 
 @pytest.fixture
-def mock_ollama_service() -> MagicMock:
+def mock_ollama_service(app: FastAPI) -> MagicMock:
     """
     Fixture to mock the v1 OllamaService using FastAPI's dependency overrides.
     """
+    from src.olm_api.api.v1.ollama_service_v1 import OllamaServiceV1
+
     mock_service = MagicMock()
     mock_service.generate_response = AsyncMock()
     mock_service.list_models = AsyncMock()
@@ -96,10 +165,12 @@ def mock_ollama_service() -> MagicMock:
 
 
 @pytest.fixture
-def mock_ollama_service_v2() -> MagicMock:
+def mock_ollama_service_v2(app: FastAPI) -> MagicMock:
     """
     Fixture to mock the v2 OllamaServiceV2 using FastAPI's dependency overrides.
     """
+    from src.olm_api.api.v2.ollama_service_v2 import OllamaServiceV2
+
     mock_service = MagicMock()
     mock_service.chat_completion = AsyncMock()
     mock_service.list_models = AsyncMock()
@@ -115,7 +186,9 @@ def mock_ollama_service_v2() -> MagicMock:
 
 
 @pytest.fixture
-async def unit_test_client(monkeypatch) -> AsyncGenerator[AsyncClient, None]:
+async def unit_test_client(
+    app: FastAPI, monkeypatch
+) -> AsyncGenerator[AsyncClient, None]:
     """
     Provides a test client that operates independently of the database.
 
@@ -135,6 +208,8 @@ async def unit_test_client(monkeypatch) -> AsyncGenerator[AsyncClient, None]:
     monkeypatch.setenv("BUILT_IN_OLLAMA_MODELS", "test-built-in-model")
 
     # 2. Disable the DB logging middleware to prevent DB writes
+    from src.olm_api.middlewares import db_logging_middleware
+
     monkeypatch.setattr(
         db_logging_middleware.LoggingMiddleware,
         "_safe_log",
@@ -173,13 +248,3 @@ def get_model_name() -> str:
     # Manually configure the model name here
     model_name = "qwen3:1.7b"
     return model_name
-
-
-# =============================================================================
-# Environment Configuration
-# =============================================================================
-
-# Set environment variables for Docker Compose
-os.environ["HOST_BIND_IP"] = os.getenv("HOST_BIND_IP", "127.0.0.1")
-os.environ["TEST_PORT"] = os.getenv("TEST_PORT", "8002")
-os.environ["BUILT_IN_OLLAMA_MODELS"] = os.getenv("BUILT_IN_OLLAMA_MODELS", "qwen3:0.6b")
@@ -8,21 +8,39 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
 from alembic import command
 from alembic.config import Config
 from olm_api.api.v1.ollama_service_v1 import OllamaServiceV1
-from olm_api.db.database import create_db_session
-from olm_api.logs.models import Log
+from olm_api.db.database import get_db
 from olm_api.main import app
 from olm_api.middlewares import db_logging_middleware
 
 
+@pytest.fixture(scope="session")
+def db_environment() -> Generator[None, None, None]:
+    """
+    Session-scoped fixture that applies the environment required by DB tests.
+
+    It runs on the master and on every xdist worker alike, so settings never
+    depend on which node happened to start the database container.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # Set a dummy model for DB tests, which don't need a real one.
+        # This is required for Alembic's env.py to validate settings.
+        mp.setenv("BUILT_IN_OLLAMA_MODELS", "test-db-model")
+        # Enable API logging for DB middleware tests
+        mp.setenv("API_LOGGING_ENABLED", "true")
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def db_setup(
-    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+    db_environment: None,
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> Generator[str, None, None]:
     """
     Session-scoped fixture to manage the test database container.
@@ -43,12 +61,6 @@ def db_setup(
     db_url_value: str
 
     if is_master:
-        # Set a dummy model for DB tests, which don't need a real one.
-        # This is required for Alembic's env.py to validate settings.
-        os.environ["BUILT_IN_OLLAMA_MODELS"] = "test-db-model"
-        # Enable API logging for DB middleware tests
-        os.environ["API_LOGGING_ENABLED"] = "true"
-
         # Enable testcontainers logging to show container startup progress
         logging.getLogger("testcontainers").setLevel(logging.INFO)
         print("\n🚀 Starting PostgreSQL test container...")
@@ -107,33 +119,44 @@ def db_url(db_setup: str) -> str:
     return db_setup
 
 
+@pytest.fixture(scope="session")
+def db_engine(db_url: str) -> Generator[Engine, None, None]:
+    """
+    Session-scoped engine, so the connection pool is created once per run.
+    """
+    engine = create_engine(db_url)
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture
-def db_session(db_url: str, monkeypatch) -> Generator[Session, None, None]:
+def db_session(db_engine: Engine, monkeypatch) -> Generator[Session, None, None]:
     """
     Provides a transactional scope for each test function.
+
+    The session is bound to a connection whose outer transaction is rolled
+    back on teardown. Commits made by the code under test only release a
+    SAVEPOINT, so no rows outlive the test and no cleanup queries are needed.
     """
-    engine: Optional[Engine] = None
-    db: Optional[Session] = None
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
-        engine = create_engine(db_url)
-        TestingSessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=engine
-        )
-        db = TestingSessionLocal()
-
+        # The middleware is not dependency-injected, so it has to be patched;
+        # routes receive the session through their get_db dependency.
         monkeypatch.setattr(db_logging_middleware, "create_db_session", lambda: db)
-        app.dependency_overrides[create_db_session] = lambda: db
+        app.dependency_overrides[get_db] = lambda: db
 
         yield db
     finally:
-        if db:
-            db.rollback()
-            db.query(Log).delete()
-            db.commit()
-            db.close()
-        if engine:
-            engine.dispose()
-        app.dependency_overrides.pop(create_db_session, None)
+        db.close()
+        transaction.rollback()
+        connection.close()
+        app.dependency_overrides.pop(get_db, None)
 
 
 @pytest.fixture
@@ -1,6 +1,5 @@
 from unittest.mock import MagicMock
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.orm import Session
 from starlette.responses import StreamingResponse
@@ -8,8 +7,14 @@ from starlette.responses import StreamingResponse
 from olm_api.api.v1.ollama_service_v1 import GenerateResponse
 from olm_api.logs.models import Log
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+# SSE chunks returned by the mocked streaming service, encoded once per module
+_SSE_CHUNKS = (
+    'data: {"full_response": "Once "}\n\n',
+    'data: {"full_response": "upon "}\n\n',
+    'data: {"full_response": "a time."}\n\n',
+)
+_SSE_CHUNKS_BYTES = tuple(c.encode("utf-8") for c in _SSE_CHUNKS)
+_SSE_JOINED = b"".join(_SSE_CHUNKS_BYTES)
 
 
 async def test_generate_logs_prompt_and_response(
@@ -35,8 +40,7 @@ async def test_generate_logs_prompt_and_response(
 
     # Assert
     assert response.status_code == 200
-    log_entry = db_session.query(Log).order_by(Log.id.desc()).first()
-    assert log_entry is not None
+    log_entry = db_session.query(Log).one()
     assert log_entry.response_status_code == 200
     assert log_entry.prompt == prompt
     assert log_entry.generated_response == expected_response
@@ -53,15 +57,9 @@ async def test_generate_streaming_logs_full_response(
     # Arrange
     prompt = "Stream me a story."
     model_name = "test-model"
-    sse_chunks = [
-        'data: {"full_response": "Once "}\n\n',
-        'data: {"full_response": "upon "}\n\n',
-        'data: {"full_response": "a time."}\n\n',
-    ]
-    stream_chunks_bytes = [c.encode("utf-8") for c in sse_chunks]
 
     async def stream_generator():
-        for chunk in stream_chunks_bytes:
+        for chunk in _SSE_CHUNKS_BYTES:
             yield chunk
 
     # The service returns a StreamingResponse for stream=True
@@ -80,11 +78,10 @@ async def test_generate_streaming_logs_full_response(
 
     # Ensure the client can consume the stream
     content = await response.aread()
-    assert content == b"".join(stream_chunks_bytes)
+    assert content == _SSE_JOINED
 
     # Verify the log entry
-    log_entry = db_session.query(Log).order_by(Log.id.desc()).first()
-    assert log_entry is not None
+    log_entry = db_session.query(Log).one()
     assert log_entry.response_status_code == 200
     assert log_entry.prompt == prompt
     assert log_entry.generated_response == "[stream omitted]"
@@ -118,8 +115,7 @@ async def test_generate_api_error_is_logged(
     assert response.status_code == 500
 
     # Assert
-    log_entry = db_session.query(Log).order_by(Log.id.desc()).first()
-    assert log_entry is not None
+    log_entry = db_session.query(Log).one()
     assert (
         log_entry.response_status_code == 500
     )  # Default code for unhandled exceptions
@@ -0,0 +1,31 @@
+"""
+Helpers for reading Server-Sent Events (SSE) responses in E2E tests.
+"""
+
+import json
+import re
+
+# Payload of every `data:` line; MULTILINE lets one findall scan the whole body
+_DATA_LINE = re.compile(rb"^data: ?(.*?)\r?$", re.MULTILINE)
+
+
+def parse_sse(body: bytes) -> list[dict]:
+    """
+    Parse the JSON payloads of an SSE response body.
+
+    The body is scanned once as bytes rather than decoded and split line by
+    line. Parsing stops at the `[DONE]` sentinel; empty and non-JSON payloads
+    are skipped.
+    """
+    chunks = []
+    for data in _DATA_LINE.findall(body):
+        data = data.strip()
+        if data == b"[DONE]":
+            break
+        if not data:
+            continue
+        try:
+            chunks.append(json.loads(data))
+        except json.JSONDecodeError:
+            continue
+    return chunks
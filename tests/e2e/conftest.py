@@ -4,21 +4,24 @@ This file contains the e2e_setup fixture that manages the Docker Compose environ
 """
 
 import os
+import socket
 import subprocess
-import time
 from typing import AsyncGenerator, Generator
 
 import httpx
 import pytest
+import pytest_asyncio
 
+from tests._compose import COMPOSE_DOWN, docker_command, start_stack
 
-@pytest.fixture
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def http_client(api_config) -> AsyncGenerator[httpx.AsyncClient, None]:
     """
     Fixture to provide an async HTTP client for making requests to the API.
 
-    This fixture creates an httpx.AsyncClient with appropriate timeout settings
-    for testing against the running Docker Compose services.
+    A single client is shared by the whole session so keep-alive connections
+    to the running Docker Compose services are reused across tests.
     """
     async with httpx.AsyncClient(
         base_url=api_config["base_url"], timeout=300.0
@@ -26,12 +29,13 @@ async def http_client(api_config) -> AsyncGenerator[httpx.AsyncClient, None]:
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_config():
     """
     Fixture to provide consistent API configuration for E2E tests.
 
-    Returns configuration with fixed endpoint URLs and model name
+    Returns configuration with fixed endpoint URLs, the default model name
+    and the thinking-capable model exercised by the think-parameter tests,
     to ensure consistent testing across all E2E tests.
     """
     host_port = os.getenv("TEST_PORT", "8002")
@@ -42,6 +46,22 @@ def api_config():
         "v1_generate_url": f"http://localhost:{host_port}/api/v1/chat",
         "v2_chat_completions_url": f"http://localhost:{host_port}/api/v2/chat",
         "model_name": model_name,
+        "thinking_model_name": "qwen3:0.6b",
+    }
+
+
+@pytest.fixture
+def chat_payload(api_config) -> dict:
+    """
+    Fixture to provide the basic non-streaming v2 chat request.
+
+    A fresh dict is returned for each test so tests can add or override
+    fields (e.g. `think`, `stream`) without affecting one another.
+    """
+    return {
+        "model": api_config["model_name"],
+        "messages": [{"role": "user", "content": "Hello"}],
+        "stream": False,
     }
 
 
@@ -51,85 +71,54 @@ def e2e_setup() -> Generator[None, None, None]:
     Manages the lifecycle of the application for end-to-end testing.
     This fixture is automatically invoked for all tests in the 'e2e' directory.
     """
-    # Determine if sudo should be used based on environment variable
-    use_sudo = os.getenv("SUDO", "").lower() in ("1", "true", "yes")
-    docker_command = ["sudo", "-E", "docker"] if use_sudo else ["docker"]
+    docker = docker_command()
 
     host_bind_ip = os.getenv("HOST_BIND_IP", "127.0.0.1")
     test_port = os.getenv("TEST_PORT", "8002")
-    health_url = f"http://{host_bind_ip}:{test_port}/health"
-
-    # Define compose commands
-    compose_up_command = docker_command + [
-        "compose",
-        "-f",
-        "docker-compose.yml",
-        "-f",
-        "docker-compose.test.override.yml",
-        "--project-name",
-        "olm-api-test",
-        "up",
-        "-d",
-    ]
-    compose_down_command = docker_command + [
-        "compose",
-        "-f",
-        "docker-compose.yml",
-        "-f",
-        "docker-compose.test.override.yml",
-        "--project-name",
-        "olm-api-test",
-        "down",
-        "-v",
-    ]
-
-    def wait_for_health_check(url: str, timeout: int = 120) -> bool:
-        """Wait for the application to be healthy."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                response = httpx.get(url, timeout=5.0)
-                if 200 <= response.status_code < 300:
-                    return True
-            except httpx.RequestError:
-                pass
-            time.sleep(2)
-        return False
+    # Resolve once so health probes do not repeat the lookup on every attempt
+    host_ip = socket.gethostbyname(host_bind_ip)
+    health_url = f"http://{host_ip}:{test_port}/health"
+
+    compose_down_command = docker + list(COMPOSE_DOWN)
 
     try:
         print("\nStarting Docker Compose services for E2E testing...")
-        result = subprocess.run(compose_up_command, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"Failed to start services.\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-            )
-
-        print(f"Waiting for application to be healthy at {health_url}...")
-        if not wait_for_health_check(health_url):
-            # If health check fails, print logs before raising error
-            logs_command = docker_command + [
-                "compose",
-                "-f",
-                "docker-compose.yml",
-                "-f",
-                "docker-compose.test.override.yml",
-                "--project-name",
-                "olm-api-test",
-                "logs",
-            ]
-            log_result = subprocess.run(logs_command, capture_output=True, text=True)
-            raise RuntimeError(
-                f"Application failed to become healthy within timeout.\nLogs:\n{log_result.stdout}\n{log_result.stderr}"
-            )
+        print(f"Checking application health at {health_url}...")
+        start_stack(docker, host_ip, int(test_port))
 
         print("✅ E2E test environment is ready.")
         yield
 
     finally:
         print("\nStopping Docker Compose services...")
+        # Only stderr is reported, so discard stdout instead of buffering it
         cleanup_result = subprocess.run(
-            compose_down_command, capture_output=True, text=True
+            compose_down_command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
         if cleanup_result.returncode != 0:
             print(f"Warning: Failed during cleanup: {cleanup_result.stderr}")
         print("E2E test cleanup completed.")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def warm_up_models(e2e_setup, http_client, api_config) -> None:
+    """
+    Loads each model used by the E2E tests once before the first test runs.
+
+    Ollama loads a model into memory on its first request, so without this
+    the load time would be charged to whichever test happens to run first.
+    Failures are ignored; the tests themselves report unavailable models.
+    """
+    for model_name in dict.fromkeys(
+        [api_config["model_name"], api_config["thinking_model_name"]]
+    ):
+        try:
+            await http_client.post(
+                api_config["v1_generate_url"],
+                json={"prompt": "Hi", "model_name": model_name, "stream": False},
+            )
+        except httpx.HTTPError as e:
+            print(f"Warning: failed to warm up model {model_name}: {e}")
@@ -1,9 +1,6 @@
-import pytest
 from httpx import AsyncClient
 from starlette import status
 
-pytestmark = pytest.mark.asyncio
-
 
 async def test_get_logs_returns_empty_list(http_client: AsyncClient, api_config):
     """
@@ -36,4 +33,4 @@ async def test_view_logs_returns_html(http_client: AsyncClient, api_config):
     assert response.status_code == status.HTTP_200_OK
     assert response.headers["content-type"].startswith("text/html")
     # A simple check to ensure it looks like our HTML page
-    assert "<h1>Request Logs</h1>" in response.text
+    assert b"<h1>Request Logs</h1>" in response.content
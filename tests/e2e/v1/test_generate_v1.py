@@ -1,13 +1,3 @@
-import pytest
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
-
 class TestGenerate:
     """Test v1 generate endpoint functionality."""
 
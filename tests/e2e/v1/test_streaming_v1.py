@@ -1,18 +1,18 @@
-import json
+import re
 
 import pytest
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+from tests.e2e._sse import parse_sse
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+DIGIT = re.compile(r"\d")
+# Fields every v1 streaming chunk carries
+CHUNK_FIELDS = frozenset({"think", "content", "full_response"})
 
 
 class TestStreaming:
     """Test v1 streaming generation functionality."""
 
+    @pytest.mark.slow
     async def test_streaming_generation(self, http_client, api_config):
         """
         Test streaming generation functionality for v1 API.
@@ -40,47 +40,28 @@ class TestStreaming:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers["content-type"]
 
-        # Collect streaming chunks
-        chunks = []
-        full_content = []
-
-        async for line in response.aiter_lines():
-            if line.startswith("data: "):
-                data_str = line[6:].strip()  # Remove "data: " prefix
-                if data_str:
-                    try:
-                        chunk = json.loads(data_str)
-                        chunks.append(chunk)
-
-                        # Collect content for full response reconstruction
-                        if "content" in chunk and chunk["content"]:
-                            full_content.append(chunk["content"])
-                    except json.JSONDecodeError:
-                        continue
+        chunks = parse_sse(response.content)
 
         # Verify we received chunks
         assert len(chunks) > 0, "Should receive at least one streaming chunk"
 
         # Verify chunk structure
-        for chunk in chunks:
-            assert (
-                "think" in chunk
-            ), f"Each chunk should have 'think' field, got: {chunk}"
-            assert (
-                "content" in chunk
-            ), f"Each chunk should have 'content' field, got: {chunk}"
-            assert (
-                "full_response" in chunk
-            ), f"Each chunk should have 'full_response' field, got: {chunk}"
-            assert isinstance(chunk["content"], str), "Content should be string"
+        malformed = [
+            chunk
+            for chunk in chunks
+            if not CHUNK_FIELDS <= chunk.keys() or not isinstance(chunk["content"], str)
+        ]
+        assert (
+            not malformed
+        ), f"Each chunk should have {sorted(CHUNK_FIELDS)} with string content, got: {malformed}"
 
         # Verify we got some actual content
-        full_response = "".join(full_content)
+        full_response = "".join(chunk["content"] for chunk in chunks)
         assert (
             len(full_response) > 0
         ), "Should receive some content in streaming response"
 
         # Verify the response makes sense for the prompt (should contain numbers)
-        assert any(
-            char.isdigit() for char in full_response
+        assert DIGIT.search(
+            full_response
         ), "Response should contain numbers for counting prompt"
@@ -1,46 +1,42 @@
 import pytest
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
 
 class TestV1ThinkParameter:
     """Test think parameter functionality in v1 API."""
 
-    async def test_think_false_with_thinking_model(self, http_client, api_config):
-        """Test think=false with a thinking-capable model."""
+    # `model_key` selects the model from `api_config`
+    @pytest.mark.parametrize(
+        "model_key, prompt, think",
+        [
+            pytest.param(
+                "thinking_model_name",
+                "What is 2+2?",
+                False,
+                id="think_false_with_thinking_model",
+            ),
+            pytest.param(
+                "thinking_model_name",
+                "What is 2+2?",
+                True,
+                id="think_true_with_thinking_model",
+            ),
+            pytest.param(
+                "model_name", "Hello", False, id="think_false_with_non_thinking_model"
+            ),
+            pytest.param("model_name", "Hello", None, id="without_think_parameter"),
+        ],
+    )
+    async def test_think_parameter(
+        self, http_client, api_config, model_key, prompt, think
+    ):
+        """Test that think=false/true/omitted all return the v1 response format."""
         payload = {
-            "prompt": "What is 2+2?",
-            "model_name": "qwen3:0.6b",  # thinking-capable model
-            "think": False,
-            "stream": False,
-        }
-
-        response = await http_client.post(api_config["v1_generate_url"], json=payload)
-        assert response.status_code == 200
-
-        data = response.json()
-        # Check new response format
-        assert "think" in data
-        assert "content" in data
-        assert "full_response" in data
-
-        # Content should not contain thinking tags
-        assert "<think>" not in data["content"]
-        assert "</think>" not in data["content"]
-
-        # Think field should be empty or not contain tags in content
-        if data["think"]:
-            assert "<think>" not in data["content"]
-
-    async def test_think_true_with_thinking_model(self, http_client, api_config):
-        """Test think=true with a thinking-capable model."""
-        payload = {
-            "prompt": "What is 2+2?",
-            "model_name": "qwen3:0.6b",  # thinking-capable model
-            "think": True,
+            "prompt": prompt,
+            "model_name": api_config[model_key],
             "stream": False,
         }
+        if think is not None:
+            payload["think"] = think
 
         response = await http_client.post(api_config["v1_generate_url"], json=payload)
         assert response.status_code == 200
@@ -52,23 +48,10 @@ class TestV1ThinkParameter:
         assert "full_response" in data
         assert isinstance(data["content"], str)
 
-    async def test_think_false_with_non_thinking_model(self, http_client, api_config):
-        """Test think=false with a non-thinking model (should be ignored)."""
-        payload = {
-            "prompt": "Hello",
-            "model_name": api_config["model_name"],  # usually gemma3:270m
-            "think": False,
-            "stream": False,
-        }
-
-        response = await http_client.post(api_config["v1_generate_url"], json=payload)
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "think" in data
-        assert "content" in data
-        assert "full_response" in data
-        assert isinstance(data["content"], str)
+        if think is False:
+            # Content should not contain thinking tags
+            assert "<think>" not in data["content"]
+            assert "</think>" not in data["content"]
 
     async def test_think_true_with_non_thinking_model(self, http_client, api_config):
         """Test think=true with a non-thinking model (should return error or be ignored)."""
@@ -84,23 +67,6 @@ class TestV1ThinkParameter:
         # We test that the API handles it gracefully
         assert response.status_code in [200, 400, 422, 502]
 
-    async def test_without_think_parameter(self, http_client, api_config):
-        """Test that omitting think parameter works as before."""
-        payload = {
-            "prompt": "Hello",
-            "model_name": api_config["model_name"],
-            "stream": False,
-        }
-
-        response = await http_client.post(api_config["v1_generate_url"], json=payload)
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "think" in data
-        assert "content" in data
-        assert "full_response" in data
-        assert isinstance(data["content"], str)
-
     async def test_think_parameter_with_streaming(self, http_client, api_config):
         """Test think parameter with streaming response."""
         payload = {
@@ -0,0 +1,15 @@
+"""
+v2 E2E test specific fixtures.
+"""
+
+import base64
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def test_image_base64() -> str:
+    """An image in base64 format for testing, read and encoded once per session."""
+    image_path = Path(__file__).parent / "test_images" / "test_image_1.png"
+    return base64.b64encode(image_path.read_bytes()).decode("ascii")
@@ -1,43 +1,36 @@
-import pytest
-
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+# Required fields of an OpenAI-compatible chat completion, checked as set
+# differences so all missing fields are reported at once
+RESPONSE_FIELDS = frozenset({"id", "object", "created", "model", "choices", "usage"})
+CHOICE_FIELDS = frozenset({"index", "message", "finish_reason"})
+MESSAGE_FIELDS = frozenset({"role", "content"})
+USAGE_FIELDS = frozenset({"prompt_tokens", "completion_tokens", "total_tokens"})
 
 
 class TestGenerate:
     """Test generation compatibility."""
 
-    async def test_compatible_response_structure(self, http_client, api_config):
+    async def test_compatible_response_structure(
+        self, http_client, api_config, chat_payload
+    ):
         """Test that response structure matches expected format."""
-        payload = {
-            "model": api_config["model_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-        }
-
         response = await http_client.post(
-            api_config["v2_chat_completions_url"], json=payload
+            api_config["v2_chat_completions_url"], json=chat_payload
         )
         data = response.json()
 
         # Check all required fields are present
-        required_fields = ["id", "object", "created", "model", "choices", "usage"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+        missing = RESPONSE_FIELDS - data.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
 
         # Check choice structure
         choice = data["choices"][0]
-        choice_fields = ["index", "message", "finish_reason"]
-        for field in choice_fields:
-            assert field in choice, f"Missing required choice field: {field}"
+        missing = CHOICE_FIELDS - choice.keys()
+        assert not missing, f"Missing required choice fields: {sorted(missing)}"
 
         # Check message structure
-        message = choice["message"]
-        message_fields = ["role", "content"]
-        for field in message_fields:
-            assert field in message, f"Missing required message field: {field}"
+        missing = MESSAGE_FIELDS - choice["message"].keys()
+        assert not missing, f"Missing required message fields: {sorted(missing)}"
 
         # Check usage structure
-        usage = data["usage"]
-        usage_fields = ["prompt_tokens", "completion_tokens", "total_tokens"]
-        for field in usage_fields:
-            assert field in usage, f"Missing required usage field: {field}"
+        missing = USAGE_FIELDS - data["usage"].keys()
+        assert not missing, f"Missing required usage fields: {sorted(missing)}"
@@ -1,9 +1,4 @@
-import json
-
-import pytest
-
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+from tests.e2e._sse import parse_sse
 
 
 class TestGenerate:
@@ -23,19 +18,7 @@ class TestGenerate:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers["content-type"]
 
-        chunks = []
-        async for line in response.aiter_lines():
-            if line.startswith("data: "):
-                data_str = line[6:].strip()
-                if data_str == "[DONE]":
-                    break
-                if data_str:
-                    try:
-                        chunk = json.loads(data_str)
-                        chunks.append(chunk)
-                    except json.JSONDecodeError:
-                        continue
-
+        chunks = parse_sse(response.content)
         assert len(chunks) > 0
         # Check first chunk has role
         first_chunk = chunks[0]
@@ -1,9 +1,3 @@
-import pytest
-
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
-
 class TestGenerate:
     """Test generation with tool calling functionality."""
 
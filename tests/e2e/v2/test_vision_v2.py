@@ -1,22 +1,32 @@
-import base64
-from pathlib import Path
-
 import pytest
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+from tests.e2e._sse import parse_sse
+
+SKIP_VISION = pytest.mark.skip(
+    reason="Vision model 'gemma3:4b' is not a built-in model."
+)
+
+
+def _assert_chat_completion(data: dict, model_name: str) -> None:
+    """Assert that `data` is a single-choice assistant chat completion."""
+    assert "id" in data
+    assert data["object"] == "chat.completion"
+    assert "created" in data
+    assert data["model"] == model_name
+    assert "choices" in data
+    assert len(data["choices"]) == 1
+
+    choice = data["choices"][0]
+    assert choice["index"] == 0
+    assert "message" in choice
+    assert choice["message"]["role"] == "assistant"
+    assert choice["message"]["content"] is not None
+    assert "usage" in data
 
 
 class TestVision:
     """Test vision/image functionality with different models."""
 
-    @pytest.fixture
-    def test_image_base64(self):
-        """An image in base64 format for testing."""
-        image_path = Path(__file__).parent / "test_images" / "test_image_1.png"
-        with open(image_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
-
     @pytest.fixture
     def vision_model_name(self):
         """Get vision-capable model name from environment."""
@@ -39,118 +49,68 @@ class TestVision:
                 return model
         return models[0] if models else "qwen3:0.6b"
 
-    @pytest.mark.skip(reason="Vision model 'gemma3:4b' is not a built-in model.")
-    async def test_vision_model_with_image_success(
-        self, http_client, api_config, test_image_base64, vision_model_name
-    ):
-        """Test that vision-capable model (gemma3) can process images."""
-        payload = {
-            "model": vision_model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": "Describe this image in one word.",
-                    "images": [test_image_base64],
-                }
-            ],
-            "stream": False,
-        }
-
-        response = await http_client.post(
-            api_config["v2_chat_completions_url"], json=payload
-        )
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "id" in data
-        assert data["object"] == "chat.completion"
-        assert "created" in data
-        assert data["model"] == vision_model_name
-        assert "choices" in data
-        assert len(data["choices"]) == 1
-
-        choice = data["choices"][0]
-        assert choice["index"] == 0
-        assert "message" in choice
-        assert choice["message"]["role"] == "assistant"
-        assert choice["message"]["content"] is not None
-        assert "usage" in data
-
-    async def test_non_vision_model_ignores_images(
-        self, http_client, api_config, test_image_base64, non_vision_model_name
-    ):
-        """Test that non-vision model (qwen3) ignores images and responds normally."""
-        payload = {
-            "model": non_vision_model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": "Hello, how are you?",
-                    "images": [test_image_base64],
-                }
-            ],
-            "stream": False,
-        }
-
-        response = await http_client.post(
-            api_config["v2_chat_completions_url"], json=payload
-        )
-        # Non-vision models ignore images and respond normally
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["object"] == "chat.completion"
-        assert data["model"] == non_vision_model_name
-        choice = data["choices"][0]
-        assert choice["message"]["role"] == "assistant"
-        assert choice["message"]["content"] is not None
-
-    @pytest.mark.skip(reason="Vision model 'gemma3:4b' is not a built-in model.")
-    async def test_vision_model_without_image_works(
-        self, http_client, api_config, vision_model_name
+    @pytest.mark.parametrize(
+        "use_vision_model, content, image_count",
+        [
+            pytest.param(
+                True,
+                "Describe this image in one word.",
+                1,
+                marks=SKIP_VISION,
+                id="vision_model_with_image",
+            ),
+            pytest.param(
+                False,
+                "Hello, how are you?",
+                1,
+                id="non_vision_model_ignores_images",
+            ),
+            pytest.param(
+                True,
+                "Hello, how are you?",
+                0,
+                marks=SKIP_VISION,
+                id="vision_model_without_image",
+            ),
+            pytest.param(
+                True,
+                "Compare these images.",
+                2,
+                marks=SKIP_VISION,
+                id="multiple_images_with_vision_model",
+            ),
+        ],
+    )
+    async def test_chat_completion_with_images(
+        self,
+        http_client,
+        api_config,
+        test_image_base64,
+        vision_model_name,
+        non_vision_model_name,
+        use_vision_model: bool,
+        content: str,
+        image_count: int,
     ):
-        """Test that vision-capable model works normally without images."""
-        payload = {
-            "model": vision_model_name,
-            "messages": [{"role": "user", "content": "Hello, how are you?"}],
-            "stream": False,
-        }
+        """
+        Test chat completions with zero, one or several images attached.
+
+        Vision-capable models process the images; non-vision models (qwen3)
+        ignore them and respond normally.
+        """
+        model_name = vision_model_name if use_vision_model else non_vision_model_name
+        message = {"role": "user", "content": content}
+        if image_count:
+            message["images"] = [test_image_base64] * image_count
+        payload = {"model": model_name, "messages": [message], "stream": False}
 
         response = await http_client.post(
             api_config["v2_chat_completions_url"], json=payload
         )
         assert response.status_code == 200
+        _assert_chat_completion(response.json(), model_name)
 
-        data = response.json()
-        assert data["object"] == "chat.completion"
-        assert data["model"] == vision_model_name
-
-    @pytest.mark.skip(reason="Vision model 'gemma3:4b' is not a built-in model.")
-    async def test_multiple_images_with_vision_model(
-        self, http_client, api_config, test_image_base64, vision_model_name
-    ):
-        """Test that vision model can handle multiple images."""
-        payload = {
-            "model": vision_model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": "Compare these images.",
-                    "images": [test_image_base64, test_image_base64],
-                }
-            ],
-            "stream": False,
-        }
-
-        response = await http_client.post(
-            api_config["v2_chat_completions_url"], json=payload
-        )
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["object"] == "chat.completion"
-
-    @pytest.mark.skip(reason="Vision model 'gemma3:4b' is not a built-in model.")
+    @SKIP_VISION
     async def test_streaming_with_images(
         self, http_client, api_config, test_image_base64, vision_model_name
     ):
@@ -174,16 +134,17 @@ class TestVision:
         assert "text/event-stream" in response.headers.get("content-type", "")
 
         # Check that we get streaming chunks
-        chunks = []
-        async for chunk in response.aiter_text():
-            if chunk.strip() and not chunk.startswith("data: [DONE]"):
-                chunks.append(chunk)
+        chunks = parse_sse(response.content)
 
         assert len(chunks) > 0
         # At least one chunk should contain content
-        assert any("content" in chunk for chunk in chunks)
+        assert any(
+            "content" in choice.get("delta", {})
+            for chunk in chunks
+            for choice in chunk.get("choices", [])
+        )
 
-    @pytest.mark.skip(reason="Vision model 'gemma3:4b' is not a built-in model.")
+    @SKIP_VISION
     async def test_invalid_base64_image_handled(
         self, http_client, api_config, vision_model_name
     ):
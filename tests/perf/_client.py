@@ -0,0 +1,66 @@
+"""
+Shared helpers for the performance tests: timed API requests, one-off
+payload encoding and deferred response logging.
+"""
+
+import json
+import time
+
+import httpx
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def make_api_request(
+    client: httpx.AsyncClient,
+    url: str,
+    body: bytes,
+    request_number: int,
+    response_key: str,
+) -> tuple[dict, float]:
+    """
+    Make a single API request and return the response data and elapsed time.
+    `body` is the JSON payload serialized once per run by `encode_payload`.
+    Raises exception if the request fails or `response_key` is missing or empty.
+    """
+    start_time = time.perf_counter()
+    try:
+        response = await client.post(url, content=body, headers=_JSON_HEADERS)
+        elapsed = time.perf_counter() - start_time
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Request {request_number} failed with status {response.status_code}: {response.text}"
+            )
+
+        response_data = json.loads(response.content)
+
+        if not response_data.get(response_key):
+            raise Exception(
+                f"Request {request_number} returned invalid response format: {response_data}"
+            )
+
+        return response_data, elapsed
+    except Exception as e:
+        elapsed = time.perf_counter() - start_time
+        raise Exception(
+            f"Request {request_number} failed after {elapsed:.2f}s: {str(e)}"
+        )
+
+
+def encode_payload(payload: dict) -> bytes:
+    """
+    Serialize a request payload once so repeated requests reuse the bytes.
+    """
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def log_responses(responses: list[tuple[int, float, dict]]) -> None:
+    """
+    Print the collected `(request_number, elapsed, response_data)` entries.
+    Called once the timed run is over so stdout writes stay out of it.
+    """
+    for request_number, elapsed, response_data in responses:
+        print(
+            f"\nRequest {request_number}: {elapsed:.2f}s - Response JSON: {json.dumps(response_data, ensure_ascii=False)}"
+        )
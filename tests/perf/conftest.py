@@ -5,121 +5,81 @@ Common fixtures including e2e_setup, load_prompt, and get_model_name are now in
 
 import os
 import subprocess
-import time
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 import httpx
 import pytest
+import pytest_asyncio
+
+from tests._compose import COMPOSE_DOWN, docker_command, start_stack
 
 # Performance tests can use all fixtures from tests/conftest.py
 # Add any performance-specific fixtures here if needed
 
 
-# Set environment variables for Docker Compose
-os.environ["HOST_BIND_IP"] = os.getenv("HOST_BIND_IP", "127.0.0.1")
-os.environ["TEST_PORT"] = os.getenv("TEST_PORT", "8002")
-os.environ["BUILT_IN_OLLAMA_MODELS"] = os.getenv("BUILT_IN_OLLAMA_MODELS", "qwen3:0.6b")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture to provide one async HTTP client for every performance request.
+
+    Keep-alive connections are reused across requests and tests, so timings
+    measure the API rather than TCP connection setup. The pool is sized for
+    the largest parallel batch.
+    """
+    host_port = os.getenv("TEST_PORT", "8002")
+    async with httpx.AsyncClient(
+        base_url=f"http://localhost:{host_port}",
+        timeout=600,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    ) as client:
+        yield client
 
 
 @pytest.fixture(scope="session", autouse=True)
 def perf_setup() -> Generator[None, None, None]:
     """
     Manages the lifecycle of the application for performance testing.
+
+    The stack is started once per pytest session for every test under
+    tests/perf. Run v1 and v2 together (`pytest tests/perf`, optionally with
+    `-k`) instead of as separate invocations so startup is paid only once.
     """
-    # Determine if sudo should be used based on environment variable
-    use_sudo = os.getenv("SUDO", "").lower() in ("1", "true", "yes")
-    docker_command = ["sudo", "-E", "docker"] if use_sudo else ["docker"]
+    docker = docker_command()
 
     host_bind_ip = os.getenv("HOST_BIND_IP", "127.0.0.1")
     host_port = os.getenv("TEST_PORT", "8002")
     health_url = f"http://{host_bind_ip}:{host_port}/health"
 
-    # Define compose commands (environment variables handled by docker-compose.test.override.yml)
-    compose_up_command = docker_command + [
-        "compose",
-        "-f",
-        "docker-compose.yml",
-        "-f",
-        "docker-compose.test.override.yml",
-        "--project-name",
-        "olm-api-test",
-        "up",
-        "-d",
-    ]
-    compose_down_command = docker_command + [
-        "compose",
-        "-f",
-        "docker-compose.yml",
-        "-f",
-        "docker-compose.test.override.yml",
-        "--project-name",
-        "olm-api-test",
-        "down",
-        "--remove-orphans",
-    ]
+    compose_down_command = docker + list(COMPOSE_DOWN)
 
     try:
-        # Start services, ensuring cleanup on failure
+        # Start services; teardown is handled once in `finally` below
         print("\n🚀 Starting Performance Test services...")
         print(f"Health check URL: {health_url}")
-        try:
-            subprocess.run(
-                compose_up_command,
-                check=True,
-                timeout=300,
-                capture_output=True,
-                text=True,
-                env=os.environ,
-            )  # 5 minutes timeout
-        except subprocess.CalledProcessError as e:
-            print("\n🛑 compose up failed; performing cleanup...")
-            print(f"Exit code: {e.returncode}")
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
-            subprocess.run(compose_down_command, check=False)
-            raise
-
-        # Health Check
-        start_time = time.time()
-        timeout = 300  # 5 minutes for external Ollama connection
-        is_healthy = False
-        while time.time() - start_time < timeout:
-            try:
-                response = httpx.get(health_url, timeout=5)
-                if response.status_code == 200:
-                    print("✅ API is healthy!")
-                    is_healthy = True
-                    break
-            except httpx.RequestError as e:
-                print(f"⏳ API not yet healthy, retrying... Error: {e}")
-            time.sleep(5)
-
-        if not is_healthy:
-            subprocess.run(
-                docker_command
-                + [
-                    "compose",
-                    "-f",
-                    "docker-compose.yml",
-                    "-f",
-                    "docker-compose.test.override.yml",
-                    "--project-name",
-                    "olm-api-test",
-                    "logs",
-                    "api",
-                ]
-            )
-            # Ensure teardown on health check failure
-            print(
-                "\n🛑 Stopping Performance Test services due to health check failure..."
-            )
-            subprocess.run(compose_down_command, check=False)
-            pytest.fail(f"API did not become healthy within {timeout} seconds.")
+        start_stack(docker, host_bind_ip, int(host_port))
+        print("✅ API is healthy!")
 
         yield
-
-        # Stop services
+    finally:
+        # Stop services on success and on any setup failure alike
         print("\n🛑 Stopping Performance Test services...")
         subprocess.run(compose_down_command, check=False)
-    finally:
-        pass
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def warm_up_model(perf_setup, http_client, get_model_name) -> None:
+    """
+    Loads the benchmarked model once before any timing starts.
+
+    Ollama loads a model into memory on its first request, so without this the
+    cold start would be counted in the first measured request. The request
+    also opens the first pooled connection. Failures are ignored; the tests
+    themselves report an unavailable model.
+    """
+    try:
+        await http_client.post(
+            "/api/v1/chat",
+            json={"prompt": "Hi", "model_name": get_model_name, "stream": False},
+        )
+    except httpx.HTTPError as e:
+        print(f"Warning: failed to warm up model {get_model_name}: {e}")
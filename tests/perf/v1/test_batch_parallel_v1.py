@@ -1,53 +1,26 @@
 import asyncio
-import json
-import os
 import time
 
 import httpx
 import pytest
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
+from tests.perf._client import encode_payload, log_responses, make_api_request
 
-
-async def make_api_request(
-    client: httpx.AsyncClient, url: str, payload: dict, request_number: int
-) -> tuple[dict, float]:
-    """
-    Make a single API request and return the response data and elapsed time.
-    Raises exception if the request fails.
-    """
-    start_time = time.time()
-    try:
-        response = await client.post(url, json=payload)
-        elapsed = time.time() - start_time
-
-        if response.status_code != 200:
-            raise Exception(
-                f"Request {request_number} failed with status {response.status_code}: {response.text}"
-            )
-
-        response_data = response.json()
-
-        # Log the JSON response
-        print(
-            f"\nRequest {request_number}: {elapsed:.2f}s - Response JSON: {json.dumps(response_data, ensure_ascii=False)}"
-        )
-
-        if "response" not in response_data:
-            raise Exception(
-                f"Request {request_number} returned invalid response format: {response_data}"
-            )
-
-        return response_data, elapsed
-    except Exception as e:
-        elapsed = time.time() - start_time
-        raise Exception(
-            f"Request {request_number} failed after {elapsed:.2f}s: {str(e)}"
-        )
+# Define test cases for parallel requests
+# Each value is the number of requests sent at once
+PARALLEL_TEST_CASES = [
+    pytest.param(1, id="1_request"),
+    pytest.param(3, id="3_requests"),
+    pytest.param(5, id="5_requests"),
+    pytest.param(10, id="10_requests"),
+    # pytest.param(30, id="30_requests"),
+    # pytest.param(50, id="50_requests"),
+    # pytest.param(100, id="100_requests"),
+]
 
 
 async def run_parallel_requests_with_timing(
+    client: httpx.AsyncClient,
     num_requests: int,
     prompt: str,
     model_name: str,
@@ -55,31 +28,32 @@ async def run_parallel_requests_with_timing(
     """
     Run parallel requests and return total elapsed time and individual request times.
     """
-    host_port = os.getenv("TEST_PORT", "8002")
-
-    generate_url = f"http://localhost:{host_port}/api/v1/chat"
-    request_payload = {
-        "prompt": prompt,
-        "model_name": model_name,
-        "stream": False,
-    }
+    generate_url = "/api/v1/chat"
+    request_body = encode_payload(
+        {
+            "prompt": prompt,
+            "model_name": model_name,
+            "stream": False,
+        }
+    )
 
-    start_time = time.time()
-    request_times = []
+    start_time = time.perf_counter()
+    request_times = [0.0] * num_requests
+    responses = []
 
     async def request_with_timing(request_num):
         try:
-            async with httpx.AsyncClient(timeout=600) as client:
-                result, individual_time = await make_api_request(
-                    client, generate_url, request_payload, request_num
-                )
+            result, individual_time = await make_api_request(
+                client, generate_url, request_body, request_num, "full_response"
+            )
 
-            request_times.append(individual_time)
+            request_times[request_num - 1] = individual_time
+            responses.append((request_num, individual_time, result))
 
             # Validate response
             if (
-                not isinstance(result.get("response"), str)
-                or len(result.get("response", "")) == 0
+                not isinstance(result.get("full_response"), str)
+                or len(result.get("full_response", "")) == 0
             ):
                 raise Exception(
                     f"Request {request_num} returned invalid response content: {result}"
@@ -89,104 +63,32 @@ async def run_parallel_requests_with_timing(
         except Exception as e:
             raise Exception(f"Request {request_num} failed: {str(e)}")
 
-    # Create and run tasks
-    tasks = [request_with_timing(i + 1) for i in range(num_requests)]
-    await asyncio.gather(*tasks)
+    # Create and run tasks; the first failure cancels the rest
+    async with asyncio.TaskGroup() as tg:
+        for i in range(num_requests):
+            tg.create_task(request_with_timing(i + 1))
 
-    total_elapsed = time.time() - start_time
-    request_times.sort()  # Sort for easier analysis
+    total_elapsed = time.perf_counter() - start_time
+    log_responses(responses)
 
     return total_elapsed, request_times
 
 
-# Individual test functions for each concurrency level
-@pytest.mark.asyncio
-async def test_1_parallel_request(load_prompt, get_model_name):
-    """Test performance with 1 concurrent request"""
-    num_requests = 1
-    total_time, request_times = await run_parallel_requests_with_timing(
-        num_requests, load_prompt, get_model_name
-    )
-
-    print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-    print(f"✅ [PARALLEL TEST: {num_requests} request] COMPLETED\n")
-
-    assert total_time > 0, "Test should take some time to complete"
-
-
-@pytest.mark.asyncio
-async def test_3_parallel_requests(load_prompt, get_model_name):
-    """Test performance with 3 parallel requests"""
-    num_requests = 3
-    total_time, request_times = await run_parallel_requests_with_timing(
-        num_requests, load_prompt, get_model_name
-    )
-
-    print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-    print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
-
-    assert total_time > 0, "Test should take some time to complete"
-
-
-@pytest.mark.asyncio
-async def test_5_parallel_requests(load_prompt, get_model_name):
-    """Test performance with 5 parallel requests"""
-    num_requests = 5
-    total_time, request_times = await run_parallel_requests_with_timing(
-        num_requests, load_prompt, get_model_name
-    )
-
-    print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-    print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
-
-    assert total_time > 0, "Test should take some time to complete"
-
-
-@pytest.mark.asyncio
-async def test_10_parallel_requests(load_prompt, get_model_name):
-    """Test performance with 10 parallel requests"""
-    num_requests = 10
+@pytest.mark.parametrize("num_requests", PARALLEL_TEST_CASES)
+async def test_parallel_performance(
+    num_requests: int,
+    http_client,
+    load_prompt,
+    get_model_name,
+):
+    """
+    Test performance with parallel requests for various concurrency levels.
+    """
     total_time, request_times = await run_parallel_requests_with_timing(
-        num_requests, load_prompt, get_model_name
+        http_client, num_requests, load_prompt, get_model_name
     )
 
-    print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
+    print(f"\n📊 Request times: {[f'{t:.2f}s' for t in sorted(request_times)]}")
     print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
 
     assert total_time > 0, "Test should take some time to complete"
-
-
-# @pytest.mark.asyncio
-# async def test_30_parallel_requests():
-#     """Test performance with 30 parallel requests"""
-#     num_requests = 30
-#     total_time, request_times = await run_parallel_requests_with_timing(num_requests)
-
-#     print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-#     print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
-
-#     assert total_time > 0, "Test should take some time to complete"
-
-
-# @pytest.mark.asyncio
-# async def test_50_parallel_requests():
-#     """Test performance with 50 parallel requests"""
-#     num_requests = 50
-#     total_time, request_times = await run_parallel_requests_with_timing(num_requests)
-
-#     print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-#     print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
-
-#     assert total_time > 0, "Test should take some time to complete"
-
-
-# @pytest.mark.asyncio
-# async def test_100_parallel_requests():
-#     """Test performance with 100 parallel requests"""
-#     num_requests = 100
-#     total_time, request_times = await run_parallel_requests_with_timing(num_requests)
-
-#     print(f"\n📊 Request times: {[f'{t:.2f}s' for t in request_times]}")
-#     print(f"✅ [PARALLEL TEST: {num_requests} requests] COMPLETED\n")
-
-#     assert total_time > 0, "Test should take some time to complete"
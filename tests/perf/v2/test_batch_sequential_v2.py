@@ -1,16 +1,11 @@
 import asyncio
-import json
-import os
+import statistics
 import time
 
 import httpx
 import pytest
 
-from tests.conftest import get_model_name, load_prompt
-
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
+from tests.perf._client import encode_payload, log_responses, make_api_request
 
 # Define test cases for sequential requests
 # Each tuple represents (num_requests, interval_seconds)
@@ -21,117 +16,83 @@ SEQUENTIAL_TEST_CASES = [
 ]
 
 
-async def make_api_request(
-    client: httpx.AsyncClient, url: str, payload: dict, request_number: int
-) -> tuple[dict, float]:
-    """
-    Make a single API request and return the response data and elapsed time.
-    Raises exception if the request fails.
-    """
-    start_time = time.time()
-    try:
-        response = await client.post(url, json=payload)
-        elapsed = time.time() - start_time
-
-        if response.status_code != 200:
-            raise Exception(
-                f"Request {request_number} failed with status {response.status_code}: {response.text}"
-            )
-
-        response_data = response.json()
-
-        # Log the JSON response with formatted content
-        if "choices" in response_data and response_data["choices"]:
-            content = response_data["choices"][0]["message"]["content"]
-            formatted_content = content.replace("</think>", "</think>\n\n")
-            formatted_response_data = response_data.copy()
-            formatted_response_data["choices"][0]["message"][
-                "content"
-            ] = formatted_content
-            print(
-                f"\nRequest {request_number}: {elapsed:.2f}s - Response JSON: {json.dumps(formatted_response_data, ensure_ascii=False)}"
-            )
-        else:
-            print(
-                f"\nRequest {request_number}: {elapsed:.2f}s - Response JSON: {json.dumps(response_data, ensure_ascii=False)}"
-            )
-
-        if "choices" not in response_data or not response_data["choices"]:
-            raise Exception(
-                f"Request {request_number} returned invalid response format: {response_data}"
-            )
-
-        return response_data, elapsed
-    except Exception as e:
-        elapsed = time.time() - start_time
-        raise Exception(
-            f"Request {request_number} failed after {elapsed:.2f}s: {str(e)}"
-        )
-
-
 async def run_sequential_requests_with_interval(
-    num_requests: int, interval_seconds: float
+    client: httpx.AsyncClient,
+    num_requests: int,
+    interval_seconds: float,
+    prompt: str,
+    model_name: str,
 ) -> tuple[float, list[float]]:
     """
     Run sequential requests with specified interval and return total elapsed time and individual request times.
+    Request starts are scheduled `interval_seconds` apart from the run start, so
+    response latency does not push later requests back (unless a response
+    outlasts the interval, in which case the next request is sent immediately).
     """
-    host_port = os.getenv("TEST_PORT", "8002")
-    model_name = get_model_name()
-
-    chat_url = f"http://localhost:{host_port}/api/v2/chat"
-    request_payload = {
-        "model": model_name,
-        "messages": [{"role": "user", "content": load_prompt()}],
-        "stream": False,
-    }
+    chat_url = "/api/v2/chat"
+    request_body = encode_payload(
+        {
+            "model": model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+        }
+    )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     request_times = []
+    responses = []
 
-    async with httpx.AsyncClient(timeout=600) as client:
-        for i in range(num_requests):
-            try:
-                result, individual_time = await make_api_request(
-                    client, chat_url, request_payload, i + 1
-                )
+    for i in range(num_requests):
+        try:
+            result, individual_time = await make_api_request(
+                client, chat_url, request_body, i + 1, "choices"
+            )
 
-                request_times.append(individual_time)
+            request_times.append(individual_time)
+            responses.append((i + 1, individual_time, result))
 
-                # Validate response
-                if (
-                    not result.get("choices")
-                    or not isinstance(
-                        result["choices"][0].get("message", {}).get("content"), str
-                    )
-                    or len(result["choices"][0]["message"]["content"]) == 0
-                ):
-                    raise Exception(
-                        f"Request {i + 1} returned invalid response content: {result}"
-                    )
+            # Validate response
+            if (
+                not result.get("choices")
+                or not isinstance(
+                    result["choices"][0].get("message", {}).get("content"), str
+                )
+                or len(result["choices"][0]["message"]["content"]) == 0
+            ):
+                raise Exception(
+                    f"Request {i + 1} returned invalid response content: {result}"
+                )
 
-                # Wait for the specified interval before next request (except for the last one)
-                if i < num_requests - 1:
-                    await asyncio.sleep(interval_seconds)
+            # Wait for the next scheduled start (except after the last one)
+            if i < num_requests - 1:
+                deadline = start_time + (i + 1) * interval_seconds
+                await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
 
-            except Exception as e:
-                raise Exception(f"Request {i + 1} failed: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Request {i + 1} failed: {str(e)}")
 
-    total_elapsed = time.time() - start_time
+    total_elapsed = time.perf_counter() - start_time
+    log_responses(responses)
     return total_elapsed, request_times
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("num_requests, interval", SEQUENTIAL_TEST_CASES)
-async def test_sequential_performance_v2(num_requests: int, interval: float):
+async def test_sequential_performance_v2(
+    num_requests: int,
+    interval: float,
+    http_client,
+    load_prompt,
+    get_model_name,
+):
     """
     Test V2 performance with sequential requests for various configurations.
     """
     total_time, request_times = await run_sequential_requests_with_interval(
-        num_requests, interval
+        http_client, num_requests, interval, load_prompt, get_model_name
     )
 
     assert request_times, "Should have recorded request times"
-    avg_time = sum(request_times) / len(request_times)
+    avg_time = statistics.fmean(request_times)
     min_time = min(request_times)
     max_time = max(request_times)
 
@@ -1,14 +1,10 @@
 from unittest.mock import MagicMock
 
-import pytest
 from httpx import AsyncClient
 from starlette import status
 
 from src.olm_api.api.v1.schemas import GenerateResponse
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
 
 async def test_generate_with_model_name(
     unit_test_client: AsyncClient, mock_ollama_service: MagicMock
@@ -4,9 +4,6 @@ import pytest
 from httpx import AsyncClient
 from starlette import status
 
-# Mark all tests in this file as asyncio
-pytestmark = pytest.mark.asyncio
-
 
 async def test_chat_completions_basic(
     unit_test_client: AsyncClient, mock_ollama_service_v2: MagicMock
@@ -125,35 +122,25 @@ async def test_chat_completions_with_tools(
     mock_ollama_service_v2.chat_completion.assert_called_once()
 
 
-async def test_chat_completions_missing_model(
-    unit_test_client: AsyncClient,
-    mock_ollama_service_v2: MagicMock,
-):
-    """
-    Test that a 422 error is returned if model is not provided.
-    """
-    # Act
-    response = await unit_test_client.post(
-        "/api/v2/chat",
-        json={"messages": [{"role": "user", "content": "test"}]},
-    )
-
-    # Assert
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    mock_ollama_service_v2.chat_completion.assert_not_called()
-
-
-async def test_chat_completions_empty_messages(
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(
+            {"messages": [{"role": "user", "content": "test"}]}, id="missing_model"
+        ),
+        pytest.param({"model": "qwen3:0.6b", "messages": []}, id="empty_messages"),
+    ],
+)
+async def test_chat_completions_invalid_request(
     unit_test_client: AsyncClient,
     mock_ollama_service_v2: MagicMock,
+    payload: dict,
 ):
     """
-    Test that a 422 error is returned if messages are empty.
+    Test that a 422 error is returned if model is missing or messages are empty.
     """
     # Act
-    response = await unit_test_client.post(
-        "/api/v2/chat", json={"model": "qwen3:0.6b", "messages": []}
-    )
+    response = await unit_test_client.post("/api/v2/chat", json=payload)
 
     # Assert
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY